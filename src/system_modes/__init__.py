@@ -6,12 +6,36 @@ __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from .core import SystemModeManager
-from .modes import GamingMode, AIMode, BalancedMode
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core import SystemModeManager, SystemStatus
+    from .modes import GamingMode, AIMode, BalancedMode
 
 __all__ = [
     "SystemModeManager",
-    "GamingMode", 
+    "SystemStatus",
+    "GamingMode",
     "AIMode",
     "BalancedMode",
 ]
+
+_LAZY_ATTRS = {
+    "SystemModeManager": ".core",
+    "SystemStatus": ".core",
+    "GamingMode": ".modes",
+    "AIMode": ".modes",
+    "BalancedMode": ".modes",
+}
+
+
+def __getattr__(name: str):
+    """Import public classes on first access so the CLI can start without them."""
+    if name in _LAZY_ATTRS:
+        import importlib
+
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
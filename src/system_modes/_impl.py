@@ -0,0 +1,143 @@
+"""
+Command implementations for the system-modes CLI.
+
+This module is only imported once a command actually runs, so it is free to
+pull in Rich and the core module at import time.
+"""
+
+import dataclasses
+import sys
+from typing import Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from .core import SystemModeManager
+from .modes import MODE_CLASSES
+
+console = Console()
+
+
+def _create_manager(*mode_names: str) -> SystemModeManager:
+    """Create a manager with only the named modes registered."""
+    manager = SystemModeManager()
+    for name in mode_names:
+        manager.register_mode(MODE_CLASSES[name]())
+    return manager
+
+
+def do_switch(mode: Optional[str], list: bool, status: bool):
+    """Switch system mode or show information."""
+    if list:
+        _show_modes(_create_manager(*MODE_CLASSES))
+    elif status:
+        _show_status(_create_manager())
+    elif mode:
+        _switch_mode(_create_manager(mode), mode)
+    else:
+        # Show current mode if no options specified
+        manager = _create_manager(*MODE_CLASSES)
+        current = manager.current_mode
+        if current:
+            console.print(f"🎯 Current mode: [green]{current}[/green]")
+        else:
+            console.print("🎯 No mode currently active (using system defaults)")
+        _show_modes(manager)
+
+
+def do_modes():
+    """List all available system modes."""
+    _show_modes(_create_manager(*MODE_CLASSES))
+
+
+def do_status():
+    """Show current system status."""
+    _show_status(_create_manager())
+
+
+def do_enable(mode: str):
+    """Enable a specific system mode."""
+    _switch_mode(_create_manager(mode), mode)
+
+
+def do_disable():
+    """Disable current mode and return to balanced."""
+    manager = _create_manager("balanced")
+    
+    current = manager.current_mode
+    if current and current != "balanced":
+        console.print(f"🔄 Disabling {current} mode...")
+        manager.switch_to_mode("balanced")
+        console.print("✅ Returned to balanced mode")
+    else:
+        console.print("ℹ️  Already in balanced mode")
+
+
+def _show_modes(manager: SystemModeManager):
+    """Display available modes in a nice table."""
+    table = Table(title="🎯 Available System Modes")
+    table.add_column("Mode", style="cyan", no_wrap=True)
+    table.add_column("Description", style="white")
+    table.add_column("Status", style="green")
+    
+    current_mode = manager.current_mode
+    
+    for name, mode in manager.modes.items():
+        status = "🟢 Active" if name == current_mode else "⚪ Inactive"
+        table.add_row(name.title(), mode.description, status)
+    
+    console.print(table)
+
+
+def _show_status(manager: SystemModeManager):
+    """Display system status in a nice table."""
+    status = manager.get_system_status()
+    
+    table = Table(title="📊 System Status")
+    table.add_column("Property", style="cyan", no_wrap=True)
+    table.add_column("Value", style="white")
+    
+    for field in dataclasses.fields(status):
+        key_display = field.name.replace("_", " ").title()
+        table.add_row(key_display, str(getattr(status, field.name)))
+    
+    console.print(table)
+    
+    # Show GPU information
+    gpus = manager.get_gpu_info()
+    if not gpus:
+        console.print("⚠️  Could not retrieve GPU information")
+        return
+    
+    gpu_table = Table(title="🎮 GPU Status")
+    gpu_table.add_column("GPU", style="cyan")
+    gpu_table.add_column("Name", style="white")
+    gpu_table.add_column("Utilization", style="green")
+    gpu_table.add_column("Memory", style="yellow")
+    
+    for gpu in gpus:
+        gpu_table.add_row(
+            gpu["index"], gpu["name"], f"{gpu['utilization']}%",
+            f"{gpu['memory_used']}MB/{gpu['memory_total']}MB",
+        )
+    
+    console.print(gpu_table)
+
+
+def _switch_mode(manager: SystemModeManager, mode: str):
+    """Switch to the specified mode."""
+    success = manager.switch_to_mode(mode)
+    if success:
+        console.print(f"✅ Successfully switched to [green]{mode}[/green] mode")
+        
+        # Show what this mode is optimized for
+        mode_info = {
+            "gaming": "🎮 Optimized for maximum gaming performance with RTX 4060 Ti",
+            "ai": "🤖 Optimized for AI development and CUDA workloads with RTX 4060 Ti",
+            "balanced": "⚖️ Standard Ubuntu settings for balanced performance and power"
+        }
+        console.print(f"💡 {mode_info.get(mode, '')}")
+    else:
+        console.print(f"❌ Failed to switch to {mode} mode")
+        sys.exit(1)
+
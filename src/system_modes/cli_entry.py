@@ -0,0 +1,39 @@
+"""
+Command-line entry point for system-modes.
+
+Only Click is imported here so that ``--help``, ``--version`` and usage
+errors return without loading Rich or the core module. Subcommands are
+imported from :mod:`system_modes.commands` on demand by :class:`LazyGroup`,
+and each one defers its work to :mod:`system_modes._impl`.
+"""
+
+import importlib
+from typing import List, Optional
+
+import click
+
+COMMANDS = ["disable", "enable", "modes", "status", "switch"]
+
+
+class LazyGroup(click.Group):
+    """Click group that imports each subcommand module only when needed."""
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted([*COMMANDS, *self.commands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in COMMANDS:
+            return super().get_command(ctx, cmd_name)
+        module = importlib.import_module(f".commands.{cmd_name}", __package__)
+        return module.cmd
+
+
+@click.group(cls=LazyGroup)
+@click.version_option(version="0.1.0")
+def main():
+    """System Modes - Switch between gaming, AI, and balanced system modes."""
+    pass
+
+
+if __name__ == "__main__":
+    main()
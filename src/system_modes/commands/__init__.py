@@ -0,0 +1,9 @@
+"""
+Subcommands for the system-modes CLI.
+
+Each module defines a Click command named ``cmd`` and is imported by
+:class:`system_modes.cli_entry.LazyGroup` only when that command is invoked
+or listed in help output.
+"""
+
+MODE_NAMES = ["gaming", "ai", "balanced"]
@@ -0,0 +1,10 @@
+"""The ``disable`` command."""
+
+import click
+
+
+@click.command(name="disable")
+def cmd():
+    """Disable current mode and return to balanced."""
+    from system_modes._impl import do_disable
+    do_disable()
@@ -0,0 +1,13 @@
+"""The ``enable`` command."""
+
+import click
+
+from . import MODE_NAMES
+
+
+@click.command(name="enable")
+@click.argument("mode", type=click.Choice(MODE_NAMES))
+def cmd(mode: str):
+    """Enable a specific system mode."""
+    from system_modes._impl import do_enable
+    do_enable(mode)
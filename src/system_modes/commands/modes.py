@@ -0,0 +1,10 @@
+"""The ``modes`` command."""
+
+import click
+
+
+@click.command(name="modes")
+def cmd():
+    """List all available system modes."""
+    from system_modes._impl import do_modes
+    do_modes()
@@ -0,0 +1,10 @@
+"""The ``status`` command."""
+
+import click
+
+
+@click.command(name="status")
+def cmd():
+    """Show current system status."""
+    from system_modes._impl import do_status
+    do_status()
@@ -0,0 +1,18 @@
+"""The ``switch`` command."""
+
+from typing import Optional
+
+import click
+
+from . import MODE_NAMES
+
+
+@click.command(name="switch")
+@click.option("--mode", "-m", type=click.Choice(MODE_NAMES), 
+              help="Mode to switch to")
+@click.option("--list", "-l", is_flag=True, help="List available modes")
+@click.option("--status", "-s", is_flag=True, help="Show current system status")
+def cmd(mode: Optional[str], list: bool, status: bool):
+    """Switch system mode or show information."""
+    from system_modes._impl import do_switch
+    do_switch(mode, list, status)
@@ -2,47 +2,335 @@
 Core system mode management functionality.
 """
 
+import atexit
+import csv
+import dataclasses
+import functools
+import io
+import json
 import os
+import shutil
 import subprocess
-from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Protocol, TypeVar
 
 import psutil
 
+T = TypeVar("T")
 
-class SystemMode(ABC):
-    """Abstract base class for system modes."""
+# How long probe results stay fresh, in seconds.
+SYSFS_CACHE_TTL = 2.0
+GPU_CACHE_TTL = 10.0
+STATUS_SNAPSHOT_TTL = 2.0
+
+_IS_ROOT = os.geteuid() == 0
+
+# Absolute path to nvidia-smi, or None on hosts without it.
+_NVIDIA_SMI = shutil.which("nvidia-smi")
+
+CPU_SYSFS_DIR = "/sys/devices/system/cpu"
+
+# nvidia-smi query fields and the keys they are reported under.
+GPU_QUERY_FIELDS = (
+    "index", "name", "persistence_mode", "utilization.gpu", "memory.used", "memory.total",
+)
+GPU_INFO_KEYS = (
+    "index", "name", "persistence_mode", "utilization", "memory_used", "memory_total",
+)
+
+_MISSING = object()
+
+# The pynvml module once NVML is initialised, False if it is unavailable.
+_nvml = None
+
+
+def _read_sysfs(path: str, default: str = "Unknown") -> str:
+    """Read a small sysfs/procfs value without building a file object."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except (FileNotFoundError, PermissionError):
+        return default
+    try:
+        return os.read(fd, 64).decode().strip()
+    except OSError:
+        return default
+    finally:
+        os.close(fd)
+
+
+def _get_nvml():
+    """Return pynvml with NVML initialised, or None if it cannot be used.
+
+    NVML is initialised on first use and shut down when the process exits.
+    """
+    global _nvml
+    if _nvml is None:
+        try:
+            import pynvml
+        except ImportError:
+            _nvml = False
+            return None
+        try:
+            pynvml.nvmlInit()
+        except pynvml.NVMLError:
+            _nvml = False
+            return None
+        atexit.register(pynvml.nvmlShutdown)
+        _nvml = pynvml
+    return _nvml or None
+
+
+def _query_gpus_nvml(nvml) -> List[Dict[str, str]]:
+    """Read GPU details directly from NVML."""
+    gpus = []
+    for index in range(nvml.nvmlDeviceGetCount()):
+        handle = nvml.nvmlDeviceGetHandleByIndex(index)
+        name = nvml.nvmlDeviceGetName(handle)
+        if isinstance(name, bytes):
+            name = name.decode()
+        persistence = nvml.nvmlDeviceGetPersistenceMode(handle)
+        memory = nvml.nvmlDeviceGetMemoryInfo(handle)
+        gpus.append({
+            "index": str(index),
+            "name": name,
+            "persistence_mode": (
+                "Enabled" if persistence == nvml.NVML_FEATURE_ENABLED else "Disabled"
+            ),
+            "utilization": str(nvml.nvmlDeviceGetUtilizationRates(handle).gpu),
+            "memory_used": str(memory.used // (1024 * 1024)),
+            "memory_total": str(memory.total // (1024 * 1024)),
+        })
+    return gpus
+
+
+def _query_gpus_nvidia_smi() -> List[Dict[str, str]]:
+    """Read GPU details with a single nvidia-smi call."""
+    if _NVIDIA_SMI is None:
+        return []
+    try:
+        result = subprocess.run(
+            [_NVIDIA_SMI, "--query-gpu=" + ",".join(GPU_QUERY_FIELDS),
+             "--format=csv,noheader,nounits"],
+            capture_output=True, text=True, check=False
+        )
+    except FileNotFoundError:
+        return []
+    if result.returncode != 0:
+        return []
+    
+    return _parse_gpu_csv(result.stdout)
+
+
+def _parse_gpu_csv(output: str) -> List[Dict[str, str]]:
+    """Parse ``nvidia-smi --format=csv,noheader,nounits`` output into GPU dicts.
+
+    Blank or malformed rows are skipped.
+    """
+    reader = csv.reader(io.StringIO(output), skipinitialspace=True)
+    return [
+        dict(zip(GPU_INFO_KEYS, row)) for row in reader
+        if len(row) == len(GPU_INFO_KEYS)
+    ]
+
+
+def _ttl_cache(ttl: float, stale_while_revalidate: bool = False) -> Callable:
+    """Cache a status probe's result for ``ttl`` seconds.
+
+    The probes read system-wide state, so the cached value is shared by all
+    instances. Pass ``refresh=True`` to the wrapped method to bypass the cache.
+    With ``stale_while_revalidate``, an expired value is returned immediately
+    while a daemon thread fetches a new one; only the first call blocks.
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        lock = threading.Lock()
+        # ``generation`` changes whenever the cache is cleared or stored to,
+        # so a load that started before then does not overwrite newer state.
+        state = {"value": _MISSING, "expires": 0.0, "generation": 0, "refreshing": False}
+
+        def load(self) -> T:
+            with lock:
+                generation = state["generation"]
+            value = func(self)
+            with lock:
+                if state["generation"] == generation:
+                    state["value"] = value
+                    state["expires"] = time.monotonic() + ttl
+                    state["generation"] += 1
+            return value
+
+        def revalidate(self) -> None:
+            try:
+                load(self)
+            finally:
+                with lock:
+                    state["refreshing"] = False
+
+        @functools.wraps(func)
+        def wrapper(self, *, refresh: bool = False) -> T:
+            if not refresh:
+                with lock:
+                    value = state["value"]
+                    if value is not _MISSING:
+                        if time.monotonic() < state["expires"]:
+                            return value
+                        if stale_while_revalidate:
+                            if not state["refreshing"]:
+                                state["refreshing"] = True
+                                threading.Thread(
+                                    target=revalidate, args=(self,), daemon=True
+                                ).start()
+                            return value
+            return load(self)
+
+        def cache_clear() -> None:
+            with lock:
+                state["value"] = _MISSING
+                state["expires"] = 0.0
+                state["generation"] += 1
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+@dataclasses.dataclass(slots=True)
+class SystemStatus:
+    """Snapshot of the system settings that modes change."""
+    
+    cpu_governor: str = "Unknown"
+    gpu_persistence: str = "Unknown"
+    memory_swappiness: str = "Unknown"
+    cpu_frequency: str = "Unknown"
+    memory_usage: str = "Unknown"
+    load_average: str = "Unknown"
+    current_mode: str = "Unknown"
+
+
+# Status fields shared between processes; current_mode is per manager.
+_SNAPSHOT_FIELDS = frozenset(
+    field.name for field in dataclasses.fields(SystemStatus)
+) - {"current_mode"}
+
+
+def _default_snapshot_path() -> str:
+    """Pick a per-user location for the shared status snapshot."""
+    uid = os.getuid()
+    runtime_dir = f"/run/user/{uid}"
+    if os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "system-modes-status.json")
+    return os.path.join(tempfile.gettempdir(), f"system-modes-status-{uid}.json")
+
+
+STATUS_SNAPSHOT_PATH = _default_snapshot_path()
+
+# Monotonic time this process last wrote the snapshot, None if it never has.
+_snapshot_written_at: Optional[float] = None
+
+
+def _load_status_snapshot() -> Optional[Dict[str, str]]:
+    """Return another process's status snapshot if it is still fresh.
+
+    Once this process has probed the system itself its in-memory probe cache
+    is at least as fresh, so the snapshot is only consulted before that.
+    """
+    if _snapshot_written_at is not None:
+        return None
+    path = STATUS_SNAPSHOT_PATH
+    try:
+        info = os.stat(path)
+        if info.st_uid != os.getuid() or time.time() - info.st_mtime >= STATUS_SNAPSHOT_TTL:
+            return None
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            data = os.read(fd, info.st_size + 1)
+        finally:
+            os.close(fd)
+        snapshot = json.loads(data)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.keys() != _SNAPSHOT_FIELDS:
+        return None
+    return snapshot
+
+
+def _save_status_snapshot(status: SystemStatus) -> None:
+    """Atomically publish ``status``, at most once per snapshot TTL."""
+    global _snapshot_written_at
+    now = time.monotonic()
+    if _snapshot_written_at is not None and now - _snapshot_written_at < STATUS_SNAPSHOT_TTL:
+        return
+    _snapshot_written_at = now
+    
+    path = STATUS_SNAPSHOT_PATH
+    data = json.dumps({name: getattr(status, name) for name in _SNAPSHOT_FIELDS})
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            os.write(fd, data.encode())
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except OSError:
+        _remove_file(tmp_path)
+
+
+def _clear_status_snapshot() -> None:
+    """Discard the shared snapshot so the next status read probes the system."""
+    global _snapshot_written_at
+    _snapshot_written_at = None
+    _remove_file(STATUS_SNAPSHOT_PATH)
+
+
+def _remove_file(path: str) -> None:
+    """Delete ``path``, ignoring errors."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+class SystemMode(Protocol):
+    """Interface that system modes implement.
+
+    Modes do not need to inherit from this class; any object with these
+    attributes and methods can be registered with a manager.
+    """
     
     name: str
     description: str
     
-    @abstractmethod
     def enable(self) -> bool:
         """Enable this system mode."""
-        pass
+        ...
     
-    @abstractmethod
     def disable(self) -> bool:
         """Disable this system mode."""
-        pass
+        ...
     
-    @abstractmethod
     def get_status(self) -> Dict[str, str]:
         """Get current status of this mode."""
-        pass
+        ...
 
 
 class SystemModeManager:
     """Manages system mode switching between gaming, AI, and balanced modes."""
     
+    __slots__ = ("modes", "current_mode", "_checked_root")
+    
     def __init__(self):
         self.modes: Dict[str, SystemMode] = {}
         self.current_mode: Optional[str] = None
-        self._check_root()
+        self._checked_root = False
     
     def _check_root(self) -> None:
-        """Check if running with root privileges."""
-        if os.geteuid() != 0:
+        """Warn once per manager if not running with root privileges."""
+        self._checked_root = True
+        if not _IS_ROOT:
             print("⚠️  Warning: Some operations require root privileges")
             print("   Run with 'sudo' for full functionality")
     
@@ -56,65 +344,142 @@ class SystemModeManager:
     
     def switch_to_mode(self, mode_name: str) -> bool:
         """Switch to the specified system mode."""
-        if mode_name not in self.modes:
+        if not self._checked_root:
+            self._check_root()
+        
+        modes = self.modes
+        mode = modes.get(mode_name)
+        if mode is None:
             print(f"❌ Mode '{mode_name}' not found")
             return False
         
         print(f"🔄 Switching to {mode_name} mode...")
         
         # Disable current mode if any
-        if self.current_mode and self.current_mode in self.modes:
-            self.modes[self.current_mode].disable()
+        current = self.current_mode
+        previous = modes.get(current) if current else None
+        if previous is not None:
+            previous.disable()
         
         # Enable new mode
-        success = self.modes[mode_name].enable()
+        success = mode.enable()
         if success:
             self.current_mode = mode_name
+            self.clear_status_cache()
             print(f"✅ Successfully switched to {mode_name} mode")
         else:
             print(f"❌ Failed to switch to {mode_name} mode")
         
         return success
     
-    def get_current_mode(self) -> Optional[str]:
-        """Get the name of the currently active mode."""
-        return self.current_mode
-    
-    def get_system_status(self) -> Dict[str, str]:
-        """Get overall system status."""
-        status = {
-            "cpu_governor": self._get_cpu_governor(),
-            "gpu_persistence": self._get_gpu_persistence(),
-            "memory_swappiness": self._get_memory_swappiness(),
-            "current_mode": self.current_mode or "Unknown",
-        }
+    def get_system_status(
+        self, refresh: bool = False, reuse: Optional[SystemStatus] = None
+    ) -> SystemStatus:
+        """Get overall system status.
+
+        Probe results are cached briefly, and a fresh snapshot written by
+        another process is reused; pass ``refresh=True`` to re-read them.
+        Polling callers can pass a ``SystemStatus`` as ``reuse`` to have it
+        updated in place instead of allocating a new one.
+        """
+        status = reuse if reuse is not None else SystemStatus()
+        snapshot = None if refresh else _load_status_snapshot()
+        if snapshot is not None:
+            for name, value in snapshot.items():
+                setattr(status, name, value)
+        else:
+            status.cpu_governor = self._get_cpu_governor(refresh=refresh)
+            status.gpu_persistence = self._get_gpu_persistence(refresh=refresh)
+            status.memory_swappiness = self._get_memory_swappiness(refresh=refresh)
+            status.cpu_frequency = self._get_cpu_freq(refresh=refresh)
+            status.memory_usage = self._get_memory_percent(refresh=refresh)
+            status.load_average = self._get_load_avg(refresh=refresh)
+            _save_status_snapshot(status)
+        status.current_mode = self.current_mode or "Unknown"
         return status
     
+    def clear_status_cache(self) -> None:
+        """Drop cached probe results so the next status read is fresh."""
+        self._get_cpu_governor.cache_clear()
+        self._get_gpu_info_all.cache_clear()
+        self._get_memory_swappiness.cache_clear()
+        self._get_cpu_freq.cache_clear()
+        self._get_memory_percent.cache_clear()
+        self._get_load_avg.cache_clear()
+        _clear_status_snapshot()
+    
+    @_ttl_cache(SYSFS_CACHE_TTL)
     def _get_cpu_governor(self) -> str:
-        """Get current CPU governor."""
+        """Get the CPU governor used by the most CPUs."""
+        governors = Counter(self._get_all_cpu_governors().values())
+        governors.pop("Unknown", None)
+        if not governors:
+            return "Unknown"
+        return governors.most_common(1)[0][0]
+    
+    def _get_all_cpu_governors(self) -> Dict[str, str]:
+        """Get the scaling governor of every CPU, keyed by CPU name."""
         try:
-            with open("/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor", "r") as f:
-                return f.read().strip()
+            with os.scandir(CPU_SYSFS_DIR) as entries:
+                cpus = sorted(
+                    (entry.name for entry in entries
+                     if entry.name.startswith("cpu") and entry.name[3:].isdigit()),
+                    key=lambda name: int(name[3:]),
+                )
         except (FileNotFoundError, PermissionError):
-            return "Unknown"
+            return {}
+        return {
+            cpu: _read_sysfs(f"{CPU_SYSFS_DIR}/{cpu}/cpufreq/scaling_governor")
+            for cpu in cpus
+        }
+    
+    def get_gpu_info(self, refresh: bool = False) -> List[Dict[str, str]]:
+        """Get per-GPU details, or an empty list if no NVIDIA GPU is available."""
+        return self._get_gpu_info_all(refresh=refresh)
     
-    def _get_gpu_persistence(self) -> str:
+    def _get_gpu_persistence(self, refresh: bool = False) -> str:
         """Get GPU persistence mode."""
-        try:
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=persistence_mode", "--format=csv,noheader,nounits"],
-                capture_output=True, text=True, check=True
-            )
-            return result.stdout.strip().split(",")[0]
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return "Unknown"
+        gpus = self._get_gpu_info_all(refresh=refresh)
+        return gpus[0]["persistence_mode"] if gpus else "Unknown"
+    
+    @_ttl_cache(GPU_CACHE_TTL, stale_while_revalidate=True)
+    def _get_gpu_info_all(self) -> List[Dict[str, str]]:
+        """Query every GPU, via NVML when available and nvidia-smi otherwise."""
+        nvml = _get_nvml()
+        if nvml is not None:
+            try:
+                return _query_gpus_nvml(nvml)
+            except nvml.NVMLError:
+                pass
+        return _query_gpus_nvidia_smi()
     
+    @_ttl_cache(SYSFS_CACHE_TTL)
     def _get_memory_swappiness(self) -> str:
         """Get memory swappiness value."""
+        return _read_sysfs("/proc/sys/vm/swappiness")
+    
+    @_ttl_cache(SYSFS_CACHE_TTL)
+    def _get_cpu_freq(self) -> str:
+        """Get current CPU frequency."""
         try:
-            with open("/proc/sys/vm/swappiness", "r") as f:
-                return f.read().strip()
-        except (FileNotFoundError, PermissionError):
+            freq = psutil.cpu_freq()
+        except (OSError, NotImplementedError):
+            return "Unknown"
+        if not freq:
+            return "Unknown"
+        return f"{freq.current:.0f} MHz"
+    
+    @_ttl_cache(SYSFS_CACHE_TTL)
+    def _get_memory_percent(self) -> str:
+        """Get the percentage of physical memory in use."""
+        return f"{psutil.virtual_memory().percent:.1f}%"
+    
+    @_ttl_cache(SYSFS_CACHE_TTL)
+    def _get_load_avg(self) -> str:
+        """Get the 1, 5 and 15 minute load averages."""
+        try:
+            return ", ".join(f"{load:.2f}" for load in psutil.getloadavg())
+        except OSError:
             return "Unknown"
     
     def list_modes(self) -> None:
@@ -131,7 +496,7 @@ class SystemModeManager:
         status = self.get_system_status()
         print("📊 System Status:")
         print("=================")
-        for key, value in status.items():
-            key_display = key.replace("_", " ").title()
-            print(f"  {key_display}: {value}")
+        for field in dataclasses.fields(status):
+            key_display = field.name.replace("_", " ").title()
+            print(f"  {key_display}: {getattr(status, field.name)}")
         print()
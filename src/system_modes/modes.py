@@ -1,43 +1,46 @@
 """System mode implementations."""
 
+from typing import Dict, Type
+
 from .core import SystemMode
-from typing import Dict
-
-class GamingMode(SystemMode):
-    name = "gaming"
-    description = "Gaming mode"
-    
-    def enable(self) -> bool:
-        return True
-    
-    def disable(self) -> bool:
-        return True
-    
-    def get_status(self) -> Dict[str, str]:
-        return {"name": self.name, "active": "False"}
-
-class AIMode(SystemMode):
-    name = "ai"
-    description = "AI mode"
-    
-    def enable(self) -> bool:
-        return True
-    
-    def disable(self) -> bool:
-        return True
-    
-    def get_status(self) -> Dict[str, str]:
-        return {"name": self.name, "active": "False"}
-
-class BalancedMode(SystemMode):
-    name = "balanced"
-    description = "Balanced mode"
-    
-    def enable(self) -> bool:
-        return True
-    
-    def disable(self) -> bool:
-        return True
-    
-    def get_status(self) -> Dict[str, str]:
-        return {"name": self.name, "active": "False"}
+
+# Class name, mode name and description for each built-in mode.
+_MODE_SPECS = [
+    ("GamingMode", "gaming", "Gaming mode"),
+    ("AIMode", "ai", "AI mode"),
+    ("BalancedMode", "balanced", "Balanced mode"),
+]
+
+
+def _enable(self) -> bool:
+    return True
+
+
+def _disable(self) -> bool:
+    return True
+
+
+def _get_status(self) -> Dict[str, str]:
+    return {"name": self.name, "active": "False"}
+
+
+def _make_mode(class_name: str, name: str, description: str) -> Type[SystemMode]:
+    """Build a mode class implementing the SystemMode protocol from its spec."""
+    return type(class_name, (), {
+        "__module__": __name__,
+        "__qualname__": class_name,
+        "__slots__": (),
+        "name": name,
+        "description": description,
+        "enable": _enable,
+        "disable": _disable,
+        "get_status": _get_status,
+    })
+
+
+GamingMode, AIMode, BalancedMode = (_make_mode(*spec) for spec in _MODE_SPECS)
+
+# Mode classes keyed by mode name.
+MODE_CLASSES: Dict[str, Type[SystemMode]] = {
+    cls.name: cls for cls in (GamingMode, AIMode, BalancedMode)
+}
@@ -1,5 +1,180 @@
 """Basic test for system-modes package."""
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_status_snapshot(tmp_path, monkeypatch):
+    """Keep tests away from the user's real status snapshot."""
+    from system_modes import core
+
+    path = tmp_path / "system-modes-status.json"
+    monkeypatch.setattr(core, "STATUS_SNAPSHOT_PATH", str(path))
+    monkeypatch.setattr(core, "_snapshot_written_at", None)
+    return path
+
+
 def test_import():
     """Test that the package can be imported."""
     from system_modes import SystemModeManager
     assert SystemModeManager is not None
+
+
+def test_cli_help_does_not_import_heavy_modules():
+    """Test that --help works without importing rich or the core module."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from click.testing import CliRunner\n"
+        "from system_modes.cli_entry import main\n"
+        "result = CliRunner().invoke(main, ['--help'])\n"
+        "assert result.exit_code == 0, result.output\n"
+        "print(sorted(m for m in ('rich', 'psutil', 'system_modes.core') if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+
+def test_ttl_cache_reuses_value_until_refresh():
+    """Test that cached probes are only re-read when stale or forced."""
+    from system_modes.core import _ttl_cache
+
+    calls = []
+
+    class Probe:
+        @_ttl_cache(60)
+        def read(self):
+            calls.append(None)
+            return len(calls)
+
+    probe = Probe()
+    assert probe.read() == 1
+    assert probe.read() == 1
+    assert probe.read(refresh=True) == 2
+    Probe.read.cache_clear()
+    assert probe.read() == 3
+
+
+def test_cpu_governor_reports_majority(tmp_path, monkeypatch):
+    """Test that the governor used by most CPUs is reported."""
+    from system_modes import core
+
+    for cpu, governor in [("cpu0", "performance"), ("cpu1", "powersave"),
+                          ("cpu2", "powersave"), ("cpufreq", None)]:
+        cpufreq = tmp_path / cpu / "cpufreq"
+        cpufreq.mkdir(parents=True)
+        if governor:
+            (cpufreq / "scaling_governor").write_text(f"{governor}\n")
+    monkeypatch.setattr(core, "CPU_SYSFS_DIR", str(tmp_path))
+
+    manager = core.SystemModeManager()
+    assert manager._get_all_cpu_governors() == {
+        "cpu0": "performance", "cpu1": "powersave", "cpu2": "powersave",
+    }
+    assert manager._get_cpu_governor(refresh=True) == "powersave"
+    manager.clear_status_cache()
+
+
+def test_parse_gpu_csv():
+    """Test parsing of nvidia-smi CSV output."""
+    from system_modes.core import _parse_gpu_csv
+
+    output = (
+        "0, NVIDIA GeForce RTX 4060 Ti, Enabled, 12, 1024, 16380\n"
+        "\n"
+        "No devices were found, 0\n"
+        "1, NVIDIA GeForce RTX 4060 Ti, Disabled, 0, 5, 16380\n"
+    )
+    gpus = _parse_gpu_csv(output)
+    assert [gpu["index"] for gpu in gpus] == ["0", "1"]
+    assert gpus[0] == {
+        "index": "0",
+        "name": "NVIDIA GeForce RTX 4060 Ti",
+        "persistence_mode": "Enabled",
+        "utilization": "12",
+        "memory_used": "1024",
+        "memory_total": "16380",
+    }
+
+
+def test_get_system_status_reuses_instance():
+    """Test that a preallocated status object is updated in place."""
+    from system_modes.core import SystemModeManager, SystemStatus
+
+    manager = SystemModeManager()
+    status = SystemStatus()
+    assert manager.get_system_status(reuse=status) is status
+    assert status.current_mode == "Unknown"
+    assert not hasattr(status, "__dict__")
+
+
+def test_status_snapshot_shared_between_processes(isolated_status_snapshot, monkeypatch):
+    """Test that a fresh on-disk snapshot is used instead of probing."""
+    import json
+
+    from system_modes import core
+
+    path = isolated_status_snapshot
+    manager = core.SystemModeManager()
+    live = manager.get_system_status(refresh=True)
+    assert path.exists()
+
+    # Simulate a new process that has not probed anything yet.
+    monkeypatch.setattr(core, "_snapshot_written_at", None)
+    snapshot = json.loads(path.read_text())
+    assert snapshot["memory_swappiness"] == live.memory_swappiness
+    snapshot["memory_swappiness"] = "snapshot"
+    path.write_text(json.dumps(snapshot))
+    assert manager.get_system_status().memory_swappiness == "snapshot"
+
+    manager.clear_status_cache()
+    assert not path.exists()
+
+
+def test_ttl_cache_clear_discards_inflight_refresh():
+    """Test that a background refresh started before cache_clear() is dropped."""
+    import threading
+
+    from system_modes.core import _ttl_cache
+
+    values = ["old"]
+    started, release = threading.Event(), threading.Event()
+
+    class Probe:
+        blocking = False
+
+        @_ttl_cache(0, stale_while_revalidate=True)
+        def read(self):
+            value = values[0]
+            if self.blocking:
+                started.set()
+                release.wait(5)
+            return value
+
+    probe = Probe()
+    assert probe.read() == "old"
+    probe.blocking = True
+    assert probe.read() == "old"  # stale value; refresh runs in the background
+    assert started.wait(5)
+
+    values[0] = "new"
+    Probe.read.cache_clear()
+    probe.blocking = False
+    assert probe.read(refresh=True) == "new"
+    release.set()
+    for thread in threading.enumerate():
+        if thread is not threading.current_thread() and thread.daemon:
+            thread.join(5)
+    assert probe.read() == "new"
+
+
+def test_cli_mode_names_match_mode_classes():
+    """Test that the CLI's mode choices match the registered mode classes."""
+    from system_modes.commands import MODE_NAMES
+    from system_modes.modes import MODE_CLASSES
+
+    assert MODE_NAMES == list(MODE_CLASSES)